@@ -0,0 +1 @@
+from .election_types import run_many  # noqa: F401
@@ -1,19 +1,20 @@
-from pydantic import BaseModel
-from typing import Optional
 from fractions import Fraction
+from pydantic import BaseModel
+from typing import Optional, Union
 
 
 class Ballot(BaseModel):
     """
     id (optional string): assigned ballot id
     ranking (list): list of candidate ranking
-    weight (float/fraction): weight assigned to a given a ballot
+    weight (float or Fraction): weight assigned to a given a ballot;
+    Fraction weights are kept as-is for the exact-arithmetic audit mode
     voters (optional list): list of voters who cast a given a ballot
     """
 
     id: Optional[str] = None
     ranking: list[set]
-    weight: Fraction
+    weight: Union[Fraction, float]
     voters: Optional[set[str]] = None
 
     class Config:
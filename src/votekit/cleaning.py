@@ -4,7 +4,6 @@ from copy import deepcopy
 from typing import Callable
 from itertools import groupby
 from functools import reduce
-from fractions import Fraction
 
 
 def remove_empty_ballots(
@@ -73,7 +72,7 @@ def merge_ballots(ballots: list[Ballot]) -> Ballot:
     if len(voters_to_merge) > 0:
         voters = reduce(lambda b1, b2: b1.union(b2), voters_to_merge)
         voters = set(voters)
-    return Ballot(ranking=ranking, voters=voters, weight=Fraction(weight))
+    return Ballot(ranking=ranking, voters=voters, weight=weight)
 
 
 # TODO: Brenda will replace this function with the function she wrote,
@@ -105,7 +104,7 @@ def deduplicate_profiles(pp: PreferenceProfile) -> PreferenceProfile:
                 dedup_ranking.append(cand)
         new_ballot = Ballot(
             id=ballot.id,
-            weight=Fraction(ballot.weight),
+            weight=ballot.weight,
             ranking=dedup_ranking,
             voters=ballot.voters,
         )
@@ -151,7 +150,7 @@ def remove_noncands(
             clean_ballot = Ballot(
                 id=ballot.id,
                 ranking=clean_ranking,
-                weight=Fraction(ballot.weight),
+                weight=ballot.weight,
                 voters=ballot.voters,
             )
 
@@ -190,7 +189,7 @@ def undervote_profile(pp: PreferenceProfile) -> PreferenceProfile:
         return Ballot(
             id=ballot.id,
             ranking=cleaned_rank_list,
-            weight=Fraction(ballot.weight),
+            weight=ballot.weight,
             voters=ballot.voters,
         )
 
@@ -1,9 +1,15 @@
-from pydantic import BaseModel
+from dataclasses import dataclass, field
 from .profile import PreferenceProfile
 from typing import Optional
+from itertools import chain
 
 
-class ElectionState(BaseModel):
+# a frozen dataclass rather than a pydantic model: one state is allocated
+# per round and carries only already-validated values, so skipping field
+# validation keeps construction off the hot path (slots would shrink it
+# further but needs python >= 3.10)
+@dataclass(frozen=True)
+class ElectionState:
     """
     curr_round (an Int): current round number
     elected (a list of Candidate): candidates who pass a certain threshold to win an election
@@ -18,47 +24,84 @@ class ElectionState(BaseModel):
     """
 
     curr_round: int
-    elected: list[str] = []
-    eliminated: list[str] = []
-    remaining: list[str] = []
     profile: PreferenceProfile
+    elected: list[str] = field(default_factory=list)
+    eliminated: list[str] = field(default_factory=list)
+    remaining: list[str] = field(default_factory=list)
     winner_votes: Optional[dict] = None
     previous: Optional["ElectionState"] = None
 
-    class Config:
-        allow_mutation = False
+    # lazy caches for the chain-walking getters; a state is immutable once
+    # built, so these never go stale
+    _all_winners: Optional[list] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _all_eliminated: Optional[list] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rankings: Optional[list] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _round_table: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_all_winners(self) -> list[str]:
         """returns all winners from all rounds so far in order of first elected to last elected"""
-        if self.previous:
-            return self.previous.get_all_winners() + self.elected
-        else:
-            return self.elected
+        winners = self._all_winners
+        if winners is None:
+            # iterate rather than recurse: long elections would otherwise pay
+            # a python frame per round and can hit the recursion limit
+            chunks = []
+            node: Optional["ElectionState"] = self
+            while node is not None:
+                chunks.append(node.elected)
+                node = node.previous
+            winners = list(chain.from_iterable(reversed(chunks)))
+            object.__setattr__(self, "_all_winners", winners)
+        return winners
 
     def get_all_eliminated(self) -> list[str]:
         """returns all winners from all rounds so
         far in order of last eliminated to first eliminated
         """
-        elim = self.eliminated.copy()
-        elim.reverse()
-        if self.previous:
-            elim += self.previous.get_all_eliminated()
-        return elim
+        eliminated = self._all_eliminated
+        if eliminated is None:
+            chunks = []
+            node: Optional["ElectionState"] = self
+            while node is not None:
+                chunks.append(reversed(node.eliminated))
+                node = node.previous
+            eliminated = list(chain.from_iterable(chunks))
+            object.__setattr__(self, "_all_eliminated", eliminated)
+        return eliminated
 
     def get_rankings(self) -> list[str]:
         """returns all candidates in order of their ranking at the end of the current round"""
-
-        return self.get_all_winners() + self.remaining + self.get_all_eliminated()
+        rankings = self._rankings
+        if rankings is None:
+            rankings = (
+                self.get_all_winners() + self.remaining + self.get_all_eliminated()
+            )
+            object.__setattr__(self, "_rankings", rankings)
+        return rankings
 
     def get_round_outcome(self, roundNum: int) -> dict:
         # {'elected':list[str], 'eliminated':list[str]}
         """returns a dictionary with elected and eliminated candidates"""
-        if self.curr_round == roundNum:
-            return {"elected": self.elected, "eliminated": self.eliminated}
-        elif self.previous:
-            return self.previous.get_round_outcome(roundNum)
-        else:
+        table = self._round_table
+        if table is None:
+            # index the chain once so later round queries skip the walk
+            table = {}
+            node: Optional["ElectionState"] = self
+            while node is not None:
+                table[node.curr_round] = node
+                node = node.previous
+            object.__setattr__(self, "_round_table", table)
+        if roundNum not in table:
             raise ValueError("Round number out of range")
+        round_state = table[roundNum]
+        return {"elected": round_state.elected, "eliminated": round_state.eliminated}
 
     def changed_rankings(self) -> dict:
         """returns dict of (key) string candidates who changed
@@ -68,19 +111,19 @@ class ElectionState(BaseModel):
         if not self.previous:
             raise ValueError("This is the first round, cannot compare previous ranking")
 
-        prev_ranking: dict = {
-            cand: index for index, cand in enumerate(self.previous.get_rankings())
-        }
-        curr_ranking: dict = {
-            cand: index for index, cand in enumerate(self.get_rankings())
-        }
-        if curr_ranking == prev_ranking:
+        prev = self.previous.get_rankings()
+        curr = self.get_rankings()
+        if prev == curr:
             return {}
 
+        prev_index = {cand: index for index, cand in enumerate(prev)}
         changes = {}
-        for candidate, index in curr_ranking.items():
-            if prev_ranking[candidate] != index:
-                changes[candidate] = (prev_ranking[candidate], index)
+        for index, cand in enumerate(curr):
+            # a candidate absent from the previous ranking is reported
+            # as coming from index -1 instead of raising
+            old_index = prev_index.get(cand, -1)
+            if old_index != index:
+                changes[cand] = (old_index, index)
         return changes
 
     ###############################################################################################
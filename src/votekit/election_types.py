@@ -1,178 +1,620 @@
-from .profile import PreferenceProfile
-from .ballot import Ballot
-from .election_state import ElectionState
-from typing import Callable
-import random
-from fractions import Fraction
-from copy import deepcopy
-from collections import namedtuple
-
-
-class STV:
-    """
-    Class for single-winner IRV and multi-winner STV elections
-    """
-
-    def __init__(self, profile: PreferenceProfile, transfer: Callable, seats: int):
-        """
-        profile (PreferenceProfile): initial perference profile
-        transfer (function): vote transfer method such as fractional transfer
-        seats (int): number of winners/size of committee
-        """
-        self.__profile = profile
-        self.transfer = transfer
-        self.seats = seats
-        self.election_state = ElectionState(
-            curr_round=0,
-            elected=[],
-            eliminated=[],
-            remaining=[
-                cand
-                for cand, votes in compute_votes(
-                    profile.get_candidates(), profile.get_ballots()
-                )
-            ],
-            profile=profile,
-        )
-        self.threshold = self.get_threshold()
-
-    # can cache since it will not change throughout rounds
-    def get_threshold(self) -> int:
-        """
-        Droop quota
-        Droop quota
-        """
-        return int(self.election_state.profile.num_ballots() / (self.seats + 1) + 1)
-
-    def next_round(self) -> bool:
-        """
-        Determines if the number of seats has been met to call election
-        """
-        return len(self.election_state.get_all_winners()) != self.seats
-
-    def run_step(self) -> ElectionState:
-        """
-        Simulates one round an STV election
-        """
-        ##TODO:must change the way we pass winner_votes
-        remaining: list[str] = self.election_state.remaining
-        ballots: list[Ballot] = self.election_state.profile.get_ballots()
-        fp_votes = compute_votes(remaining, ballots)  ##fp means first place
-        elected = []
-        eliminated = []
-
-        # if number of remaining candidates equals number of remaining seats,
-        # everyone is elected
-        if len(remaining) == self.seats - len(self.election_state.get_all_winners()):
-            elected = [cand for cand, votes in fp_votes]
-            remaining = []
-            ballots = []
-            # TODO: sort remaining candidates by vote share
-
-        # elect all candidates who crossed threshold
-        elif fp_votes[0].votes >= self.threshold:
-            for candidate, votes in fp_votes:
-                if votes >= self.threshold:
-                    elected.append(candidate)
-                    remaining.remove(candidate)
-                    ballots = self.transfer(
-                        candidate,
-                        ballots,
-                        {cand: votes for cand, votes in fp_votes},
-                        self.threshold,
-                    )
-        # since no one has crossed threshold, eliminate one of the people
-        # with least first place votes
-        elif self.next_round():
-            lp_votes = min([votes for cand, votes in fp_votes])
-            lp_candidates = [
-                candidate for candidate, votes in fp_votes if votes == lp_votes
-            ]
-            # is this how to break ties, can be different based on locality
-            lp_cand = random.choice(lp_candidates)
-            eliminated.append(lp_cand)
-            ballots = remove_cand(lp_cand, ballots)
-            remaining.remove(lp_cand)
-
-        self.election_state = ElectionState(
-            curr_round=self.election_state.curr_round + 1,
-            elected=elected,
-            eliminated=eliminated,
-            remaining=remaining,
-            profile=PreferenceProfile(ballots=ballots),
-            previous=self.election_state,
-        )
-        return self.election_state
-
-    def run_election(self) -> ElectionState:
-        """
-        Runs complete STV election
-        """
-        if not self.next_round():
-            raise ValueError(
-                f"Length of elected set equal to number of seats ({self.seats})"
-            )
-
-        while self.next_round():
-            self.run_step()
-
-        return self.election_state
-
-    def get_init_profile(self):
-        "returns the initial profile of the election"
-        return self.__profile
-
-
-## Election Helper Functions
-CandidateVotes = namedtuple("CandidateVotes", ["cand", "votes"])
-
-
-def compute_votes(candidates: list, ballots: list[Ballot]) -> list[CandidateVotes]:
-    """
-    Computes first place votes for all candidates in a preference profile
-    """
-    votes = {}
-    for candidate in candidates:
-        weight = Fraction(0)
-        for ballot in ballots:
-            if ballot.ranking and ballot.ranking[0] == {candidate}:
-                weight += ballot.weight
-        votes[candidate] = weight
-
-    ordered = [
-        CandidateVotes(cand=key, votes=value)
-        for key, value in sorted(votes.items(), key=lambda x: x[1], reverse=True)
-    ]
-
-    return ordered
-
-
-def fractional_transfer(
-    winner: str, ballots: list[Ballot], votes: dict, threshold: int
-) -> list[Ballot]:
-    """
-    Calculates fractional transfer from winner, then removes winner
-    from the list of ballots
-    """
-    transfer_value = (votes[winner] - threshold) / votes[winner]
-
-    for ballot in ballots:
-        if ballot.ranking and ballot.ranking[0] == {winner}:
-            ballot.weight = ballot.weight * transfer_value
-
-    return remove_cand(winner, ballots)
-
-
-def remove_cand(removed_cand: str, ballots: list[Ballot]) -> list[Ballot]:
-    """
-    Removes candidate from ranking of the ballots
-    """
-    update = deepcopy(ballots)
-
-    for n, ballot in enumerate(update):
-        new_ranking = [
-            candidate for candidate in ballot.ranking if candidate != {removed_cand}
-        ]
-        update[n].ranking = new_ranking
-
-    return update
+from .profile import PreferenceProfile
+from .ballot import Ballot
+from .election_state import ElectionState
+from typing import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from fractions import Fraction
+import random
+import numpy as np
+from collections import namedtuple
+from operator import itemgetter
+
+# sentinel marking padded/exhausted slots in the ballot matrix
+BALLOT_PAD = np.int8(-127)
+
+try:
+    from numba import njit  # type: ignore[import-not-found]
+except ImportError:  # numba is an optional speedup, fall back to numpy
+    njit = None  # type: ignore[assignment]
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _advance_fpv(ballot_mat, fpv_vec, pos_vec, active, idx):  # pragma: no cover
+        """
+        advances each ballot row in idx past every inactive candidate id,
+        updating the position and first-preference vectors in place
+        """
+        for i in idx:
+            pos = pos_vec[i] + 1
+            fpv = ballot_mat[i, pos]
+            while fpv >= 0 and not active[fpv]:
+                pos += 1
+                fpv = ballot_mat[i, pos]
+            pos_vec[i] = pos
+            fpv_vec[i] = fpv
+
+    @njit(cache=True)
+    def _bincount_weighted(fpv_vec, weight_vec, n_cands):  # pragma: no cover
+        """
+        first place votes per candidate id; negative ids are exhausted ballots
+        """
+        votes = np.zeros(n_cands, dtype=np.float64)
+        for i in range(fpv_vec.shape[0]):
+            fpv = fpv_vec[i]
+            if fpv >= 0:
+                votes[fpv] += weight_vec[i]
+        return votes
+
+else:
+
+    def _advance_fpv(ballot_mat, fpv_vec, pos_vec, active, idx):
+        """
+        advances each ballot row in idx past every inactive candidate id,
+        updating the position and first-preference vectors in place
+        """
+        while idx.size:
+            pos_vec[idx] += 1
+            fpv_vec[idx] = ballot_mat[idx, pos_vec[idx]]
+            fpv = fpv_vec[idx]
+            idx = idx[fpv >= 0]
+            idx = idx[~active[fpv_vec[idx]]]
+
+    def _bincount_weighted(fpv_vec, weight_vec, n_cands):
+        """
+        first place votes per candidate id; negative ids are exhausted ballots
+        """
+        mask = fpv_vec >= 0
+        return np.bincount(
+            fpv_vec[mask].astype(np.int64),
+            weights=weight_vec[mask],
+            minlength=n_cands,
+        )
+
+
+class STV:
+    """
+    Class for single-winner IRV and multi-winner STV elections
+    """
+
+    def __init__(
+        self,
+        profile: PreferenceProfile,
+        transfer: Callable,
+        seats: int,
+        exact: bool = False,
+    ):
+        """
+        profile (PreferenceProfile): initial perference profile
+        transfer (function): vote transfer method such as fractional transfer
+        seats (int): number of winners/size of committee
+        exact (bool): audit mode; tallies and transfers use Fraction
+        arithmetic instead of float64, trading speed for exact threshold
+        comparisons after chained surplus transfers
+        """
+        self.__profile = profile
+        self.transfer = transfer
+        self.seats = seats
+        self.exact = exact
+        # the fractional-transfer rounds run on a dense int8 ballot matrix
+        # instead of the Ballot objects; custom transfer callables, exact
+        # audit mode, and the rare >127 candidate contest fall back to the
+        # ballot-list step
+        self._use_matrix = (
+            not exact
+            and transfer is fractional_transfer
+            and len(profile.get_candidates()) <= 127
+        )
+        # resolve the step implementation once instead of re-dispatching on
+        # the transfer rule every round
+        self._step = (
+            self._run_step_matrix if self._use_matrix else self._run_step_ballots
+        )
+        state_profile = profile
+        if self._use_matrix:
+            self._build_ballot_matrix(profile)
+            tally = self._tally()
+            remaining = sorted(
+                self._cands,
+                key=lambda cand: tally[self._cand_ids[cand]],
+                reverse=True,
+            )
+        else:
+            # the ballot-list rounds iterate every ballot, so collapse
+            # duplicate rankings down to one weighted ballot apiece
+            state_profile = profile.condense_ballots()
+            if exact:
+                # lift the weights into Fractions once; compute_votes and
+                # fractional_transfer propagate whatever numeric type the
+                # weights carry, so every later round stays exact
+                state_profile = state_profile.with_ballots(
+                    [
+                        Ballot(
+                            id=ballot.id,
+                            ranking=ballot.ranking,
+                            weight=Fraction(ballot.weight),
+                            voters=ballot.voters,
+                        )
+                        for ballot in state_profile.get_ballots()
+                    ]
+                )
+            remaining = [
+                cand
+                for cand, votes in compute_votes(
+                    state_profile.get_candidates(), state_profile.get_ballots()
+                )
+            ]
+        self.election_state = ElectionState(
+            curr_round=0,
+            elected=[],
+            eliminated=[],
+            remaining=remaining,
+            profile=state_profile,
+        )
+        self.threshold = _droop_quota(int(profile.num_ballots()), seats)
+
+    def _build_ballot_matrix(self, profile: PreferenceProfile) -> None:
+        """
+        encodes distinct ballot rankings as rows of int8 candidate ids padded
+        with BALLOT_PAD, along with first-preference/position/weight vectors
+        """
+        self._cands: list = profile.get_candidates()
+        self._cand_ids: dict = {cand: np.int8(i) for i, cand in enumerate(self._cands)}
+        # one singleton set per candidate, shared by every decoded ranking,
+        # so converting ids back to names allocates no per-ballot sets
+        self._cand_cells = [{cand} for cand in self._cands]
+
+        # condense to one row per distinct ranking; a tied (non-singleton)
+        # position never matches a single candidate, so the ranking is
+        # truncated there just as compute_votes stalls on a tied position
+        groups: dict = {}
+        for ballot in profile.get_ballots():
+            ranking = []
+            for cand_set in ballot.ranking:
+                if len(cand_set) != 1:
+                    break
+                cand = next(iter(cand_set))
+                if cand not in self._cand_ids:
+                    break
+                ranking.append(self._cand_ids[cand])
+            key = tuple(ranking)
+            groups[key] = groups.get(key, 0) + float(ballot.weight)
+
+        n_rows = len(groups)
+        max_len = max((len(key) for key in groups), default=0)
+        self._ballot_mat = np.full((n_rows, max_len + 1), BALLOT_PAD, dtype=np.int8)
+        weights = np.empty(n_rows, dtype=np.float64)
+        for row, (key, weight) in enumerate(groups.items()):
+            self._ballot_mat[row, : len(key)] = key
+            weights[row] = weight
+
+        self._fpv_vec = self._ballot_mat[:, 0].copy()
+        self._pos_vec = np.zeros(n_rows, dtype=np.int32)
+        self._weight_vec = weights
+        self._active = np.ones(len(self._cands), dtype=bool)
+
+    def _tally(self) -> np.ndarray:
+        """
+        first place votes per candidate id as a float64 vector
+        """
+        return _bincount_weighted(self._fpv_vec, self._weight_vec, len(self._cands))
+
+    def _deactivate(self, cand_id: np.int8) -> None:
+        """
+        removes a seated or eliminated candidate and advances every ballot
+        whose first preference pointed at them past all inactive ids
+        """
+        self._active[cand_id] = False
+        idx = np.where(self._fpv_vec == cand_id)[0]
+        _advance_fpv(self._ballot_mat, self._fpv_vec, self._pos_vec, self._active, idx)
+
+    def _current_ballots(self) -> list[Ballot]:
+        """
+        decodes the matrix state back into Ballot objects for the round profile
+        """
+        ballots = []
+        for row in range(self._ballot_mat.shape[0]):
+            ranking = [
+                self._cand_cells[cand_id]
+                for cand_id in self._ballot_mat[row, self._pos_vec[row] :]
+                if cand_id >= 0 and self._active[cand_id]
+            ]
+            ballots.append(Ballot(ranking=ranking, weight=self._weight_vec[row]))
+        return ballots
+
+    def get_threshold(self) -> int:
+        """
+        Droop quota, computed once at construction since the number of
+        validly cast ballots does not change between rounds
+        """
+        return self.threshold
+
+    def next_round(self) -> bool:
+        """
+        Determines if the number of seats has been met to call election
+        """
+        return len(self.election_state.get_all_winners()) != self.seats
+
+    def run_step(self) -> ElectionState:
+        """
+        Simulates one round an STV election using the step implementation
+        bound to the transfer rule at construction
+        """
+        return self._step()
+
+    def _matrix_round(self, remaining: list, seats_left: int) -> tuple:
+        """
+        elects or eliminates on the matrix state for one round and returns
+        (elected, eliminated, remaining) without touching any ElectionState
+        """
+        remaining = list(remaining)
+        elected: list[str] = []
+        eliminated: list[str] = []
+        tally = self._tally()
+        ordered = sorted(
+            remaining, key=lambda cand: tally[self._cand_ids[cand]], reverse=True
+        )
+
+        # if number of remaining candidates equals number of remaining seats,
+        # everyone is elected
+        if len(remaining) == seats_left:
+            elected = ordered
+            remaining = []
+
+        # elect all candidates who crossed threshold and transfer surpluses
+        elif tally[self._cand_ids[ordered[0]]] >= self.threshold:
+            for candidate in ordered:
+                votes = tally[self._cand_ids[candidate]]
+                if votes >= self.threshold:
+                    elected.append(candidate)
+                    cand_id = self._cand_ids[candidate]
+                    idx = np.where(self._fpv_vec == cand_id)[0]
+                    self._weight_vec[idx] *= (votes - self.threshold) / votes
+                    self._deactivate(cand_id)
+            remaining = _remove_from_ordered(remaining, set(elected))
+
+        # since no one has crossed threshold, eliminate the trailing
+        # candidates whose combined votes cannot overtake anyone else,
+        # or failing that one of the people with least first place votes
+        elif seats_left > 0:
+            fp_votes = [
+                CandidateVotes(cand=cand, votes=tally[self._cand_ids[cand]])
+                for cand in ordered
+            ]
+            batch = _safe_elimination_batch(
+                fp_votes, len(remaining) - seats_left, self.threshold
+            )
+            if not batch:
+                # is this how to break ties, can be different based on locality
+                batch = [random.choice(_trailing_tied_candidates(fp_votes))]
+            for cand in batch:
+                eliminated.append(cand)
+                self._deactivate(self._cand_ids[cand])
+            remaining = _remove_from_ordered(remaining, set(batch))
+
+        return elected, eliminated, remaining
+
+    def _run_step_matrix(self) -> ElectionState:
+        """
+        one STV round over the ballot matrix: rounds are a handful of
+        vectorized calls instead of per-Ballot python loops
+        """
+        seats_left = self.seats - len(self.election_state.get_all_winners())
+        auto_elect = len(self.election_state.remaining) == seats_left
+        elected, eliminated, remaining = self._matrix_round(
+            self.election_state.remaining, seats_left
+        )
+        ballots = [] if auto_elect else self._current_ballots()
+
+        self.election_state = ElectionState(
+            curr_round=self.election_state.curr_round + 1,
+            elected=elected,
+            eliminated=eliminated,
+            remaining=remaining,
+            profile=self.election_state.profile.with_ballots(ballots),
+            previous=self.election_state,
+        )
+        return self.election_state
+
+    def _run_step_ballots(self) -> ElectionState:
+        """
+        one STV round over the Ballot objects, used for custom transfer methods
+        """
+        ##TODO:must change the way we pass winner_votes
+        remaining: list[str] = self.election_state.remaining
+        ballots: list[Ballot] = self.election_state.profile.get_ballots()
+        fp_votes = compute_votes(remaining, ballots)  ##fp means first place
+        elected = []
+        eliminated = []
+
+        # if number of remaining candidates equals number of remaining seats,
+        # everyone is elected
+        if len(remaining) == self.seats - len(self.election_state.get_all_winners()):
+            elected = [cand for cand, votes in fp_votes]
+            remaining = []
+            ballots = []
+            # TODO: sort remaining candidates by vote share
+
+        # elect all candidates who crossed threshold
+        elif fp_votes[0].votes >= self.threshold:
+            for candidate, votes in fp_votes:
+                if votes >= self.threshold:
+                    elected.append(candidate)
+                    ballots = self.transfer(
+                        candidate,
+                        ballots,
+                        {cand: votes for cand, votes in fp_votes},
+                        self.threshold,
+                    )
+            remaining = _remove_from_ordered(remaining, set(elected))
+        # since no one has crossed threshold, eliminate the trailing
+        # candidates whose combined votes cannot overtake anyone else,
+        # or failing that one of the people with least first place votes
+        elif self.next_round():
+            seats_left = self.seats - len(self.election_state.get_all_winners())
+            batch = _safe_elimination_batch(
+                fp_votes, len(remaining) - seats_left, self.threshold
+            )
+            if not batch:
+                # is this how to break ties, can be different based on locality
+                batch = [random.choice(_trailing_tied_candidates(fp_votes))]
+            eliminated.extend(batch)
+            ballots = remove_cands(set(batch), ballots)
+            remaining = _remove_from_ordered(remaining, set(batch))
+
+        self.election_state = ElectionState(
+            curr_round=self.election_state.curr_round + 1,
+            elected=elected,
+            eliminated=eliminated,
+            remaining=remaining,
+            profile=self.election_state.profile.with_ballots(ballots),
+            previous=self.election_state,
+        )
+        return self.election_state
+
+    def run_election(self) -> ElectionState:
+        """
+        Runs complete STV election
+        """
+        if not self.next_round():
+            raise ValueError(
+                f"Length of elected set equal to number of seats ({self.seats})"
+            )
+
+        while self.next_round():
+            self._step()
+
+        return self.election_state
+
+    def get_init_profile(self):
+        "returns the initial profile of the election"
+        return self.__profile
+
+
+def _run_one(config: dict) -> ElectionState:
+    """
+    builds and runs one STV election from a config dict; module level so
+    multiprocessing workers can pickle it
+    """
+    election = STV(
+        profile=config["profile"],
+        transfer=config.get("transfer", fractional_transfer),
+        seats=config["seats"],
+        exact=config.get("exact", False),
+    )
+    state = election.run_election()
+    if config.get("keep_history", False):
+        return state
+    # detach the round chain to cut pickling cost on the way back from a
+    # worker, but keep the flattened results queryable on the final state
+    detached = replace(state, previous=None)
+    object.__setattr__(detached, "_all_winners", state.get_all_winners())
+    object.__setattr__(detached, "_all_eliminated", state.get_all_eliminated())
+    object.__setattr__(detached, "_rankings", state.get_rankings())
+    return detached
+
+
+def run_many(configs: list[dict], n_jobs: int = -1) -> list[ElectionState]:
+    """
+    Runs independent STV elections across processes; sweeps over seats,
+    transfer rules, or profiles are embarrassingly parallel and the states
+    are immutable, so no synchronization is needed.
+
+    Each config is a dict with 'profile' and 'seats' plus optional
+    'transfer' (defaults to fractional_transfer), 'keep_history' (return
+    the full round chain instead of just the final state) and 'exact'
+    (Fraction-arithmetic audit mode). n_jobs = -1 uses all cores;
+    n_jobs = 1 runs serially in this process.
+    """
+    if n_jobs == 1 or len(configs) <= 1:
+        return [_run_one(config) for config in configs]
+
+    with ProcessPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as pool:
+        return list(pool.map(_run_one, configs))
+
+
+def stv_winner_sets(
+    profile: PreferenceProfile, seats: int, transfer: str = "fractional"
+) -> list[str]:
+    """
+    Fast path for parameter sweeps: runs the STV kernel and returns only the
+    winners in order elected, skipping the per-round ElectionState and
+    PreferenceProfile construction. Use STV(...).run_election() when the full
+    round-by-round history is needed.
+    """
+    if transfer != "fractional":
+        raise ValueError(f"Unknown transfer method: {transfer}")
+
+    election = STV(profile, fractional_transfer, seats)
+    if not election._use_matrix:
+        return election.run_election().get_all_winners()
+
+    remaining = election.election_state.remaining
+    elected: list[str] = []
+    while len(elected) != seats:
+        round_elected, _, remaining = election._matrix_round(
+            remaining, seats - len(elected)
+        )
+        elected += round_elected
+    return elected
+
+
+## Election Helper Functions
+CandidateVotes = namedtuple("CandidateVotes", ["cand", "votes"])
+
+
+def _remove_from_ordered(ordered_cands: list, removed: set) -> list:
+    """
+    drops removed candidates from an ordered candidate list in one pass;
+    repeated list.remove calls would rescan the list per candidate
+    """
+    return [cand for cand in ordered_cands if cand not in removed]
+
+
+def _trailing_tied_candidates(fp_votes: list[CandidateVotes]) -> list[str]:
+    """
+    candidates tied for the fewest first place votes; fp_votes must be
+    sorted in descending vote order, so the tied run is its tail and one
+    reverse scan finds it without re-deriving the minimum
+    """
+    lp_votes = fp_votes[-1].votes
+    i = len(fp_votes) - 1
+    while i >= 0 and fp_votes[i].votes == lp_votes:
+        i -= 1
+    return [cv.cand for cv in fp_votes[i + 1 :]]
+
+
+def _safe_elimination_batch(
+    fp_votes: list[CandidateVotes], max_size: int, threshold: int
+) -> list[str]:
+    """
+    Finds the largest group of trailing candidates whose combined first
+    place votes still fall short of the next-lowest candidate and cannot
+    lift anyone to the threshold, so that eliminating them together is
+    exactly equivalent to eliminating them one round at a time. fp_votes
+    must be sorted in descending vote order; the group is returned weakest
+    first, the order sequential elimination would remove them, and is
+    empty when not even the lowest candidate is safely separated, e.g. a
+    tie for last place
+    """
+    n = len(fp_votes)
+    best = 0
+    # integer zero: Fraction tallies from the exact audit mode must not be
+    # folded into floats before the safety comparisons
+    cumulative = 0
+    for size in range(1, min(max_size, n - 1) + 1):
+        cumulative += fp_votes[n - size].votes
+        # even if every batched vote flowed to the leader no one may reach
+        # the threshold mid-batch; an interleaved election would hand the
+        # winner a different surplus than the collapsed round does
+        if (
+            cumulative < fp_votes[n - size - 1].votes
+            and fp_votes[0].votes + cumulative < threshold
+        ):
+            best = size
+    return [cv.cand for cv in reversed(fp_votes[n - best :])] if best else []
+
+
+def _droop_quota(num_ballots: int, seats: int) -> int:
+    """
+    Droop quota: the smallest integer vote count that only `seats`
+    candidates can reach; floor division avoids the off-by-one that
+    float division can introduce near integer boundaries
+    """
+    return num_ballots // (seats + 1) + 1
+
+
+def compute_votes(candidates: list, ballots: list[Ballot]) -> list[CandidateVotes]:
+    """
+    Computes first place votes for all candidates in a preference profile
+    """
+    # integer zero so Fraction weights accumulate exactly in audit mode
+    # instead of being folded into floats
+    votes: dict = {candidate: 0 for candidate in candidates}
+    for ballot in ballots:
+        # a tied (non-singleton) first position matches no single candidate
+        # and the ballot stalls there, as in the matrix encoding
+        if not ballot.ranking or len(ballot.ranking[0]) != 1:
+            continue
+        first = next(iter(ballot.ranking[0]))
+        if first in votes:
+            votes[first] += ballot.weight
+
+    ordered = [
+        CandidateVotes(cand=key, votes=value)
+        for key, value in sorted(votes.items(), key=itemgetter(1), reverse=True)
+    ]
+
+    return ordered
+
+
+def fractional_transfer(
+    winner: str, ballots: list[Ballot], votes: dict, threshold: int
+) -> list[Ballot]:
+    """
+    Calculates fractional transfer from winner, then removes winner
+    from the list of ballots
+    """
+    transfer_value = (votes[winner] - threshold) / votes[winner]
+    winner_set = {winner}
+
+    # partition once: only the winner's pile is reweighted and only ballots
+    # actually naming the winner are rebuilt, so the rest are shared as-is
+    pile: list[Ballot] = []
+    rest: list[Ballot] = []
+    for ballot in ballots:
+        if ballot.ranking and ballot.ranking[0] == winner_set:
+            pile.append(ballot)
+        else:
+            rest.append(ballot)
+
+    pile = [
+        Ballot(
+            id=ballot.id,
+            ranking=[cand for cand in ballot.ranking[1:] if cand != winner_set],
+            weight=ballot.weight * transfer_value,
+            voters=ballot.voters,
+        )
+        for ballot in pile
+    ]
+    rest = [
+        Ballot(
+            id=ballot.id,
+            ranking=[cand for cand in ballot.ranking if cand != winner_set],
+            weight=ballot.weight,
+            voters=ballot.voters,
+        )
+        if winner_set in ballot.ranking
+        else ballot
+        for ballot in rest
+    ]
+    return rest + pile
+
+
+def remove_cand(removed_cand: str, ballots: list[Ballot]) -> list[Ballot]:
+    """
+    Removes candidate from ranking of the ballots
+    """
+    return remove_cands({removed_cand}, ballots)
+
+
+def remove_cands(removed_cands: set, ballots: list[Ballot]) -> list[Ballot]:
+    """
+    Removes a set of candidates from the rankings of the ballots
+    in a single pass
+    """
+    return [
+        Ballot(
+            id=ballot.id,
+            ranking=[
+                candidate
+                for candidate in ballot.ranking
+                if len(candidate) != 1 or next(iter(candidate)) not in removed_cands
+            ],
+            weight=ballot.weight,
+            voters=ballot.voters,
+        )
+        for ballot in ballots
+    ]
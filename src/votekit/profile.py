@@ -1,7 +1,6 @@
 from .ballot import Ballot
 from typing import Optional
 from pydantic import BaseModel, validator
-from fractions import Fraction
 
 # from functools import cache
 
@@ -43,16 +42,54 @@ class PreferenceProfile(BaseModel):
         return list(unique_cands)
 
     # can also cache
-    def num_ballots(self) -> Fraction:
+    def num_ballots(self) -> float:
         """
         Assumes weights correspond to number of ballots given to a ranking
         """
-        num_ballots = Fraction(0)
+        num_ballots = 0.0
         for ballot in self.ballots:
             num_ballots += ballot.weight
 
         return num_ballots
 
+    def condense_ballots(self) -> "PreferenceProfile":
+        """
+        Groups ballots that share a ranking into one ballot carrying their
+        summed weight, so per-ballot passes only visit each distinct
+        ranking once; real elections have far fewer ballot types than voters
+        """
+        groups: dict = {}
+        for ballot in self.ballots:
+            key = tuple(frozenset(cand_set) for cand_set in ballot.ranking)
+            groups.setdefault(key, []).append(ballot)
+
+        condensed = []
+        for group in groups.values():
+            if len(group) == 1:
+                condensed.append(group[0])
+                continue
+            voters_to_merge = [b.voters for b in group if b.voters]
+            condensed.append(
+                Ballot(
+                    ranking=group[0].ranking,
+                    weight=sum(b.weight for b in group),
+                    voters=set().union(*voters_to_merge) if voters_to_merge else None,
+                )
+            )
+        return PreferenceProfile.construct(
+            ballots=condensed, candidates=self.candidates
+        )
+
+    def with_ballots(self, ballots: list[Ballot]) -> "PreferenceProfile":
+        """
+        Returns a profile holding the given already-validated ballots,
+        skipping pydantic's re-validation of the whole ballot list; the
+        same object is shared when the list is unchanged
+        """
+        if ballots is self.ballots:
+            return self
+        return PreferenceProfile.construct(ballots=ballots, candidates=None)
+
     def to_dict(self) -> dict:
         """
         Converts ballots to dictionary with keys (ranking) and values
@@ -61,7 +98,7 @@ class PreferenceProfile(BaseModel):
         di: dict = {}
         for ballot in self.ballots:
             if str(ballot.ranking) not in di.keys():
-                di[str(ballot.ranking)] = Fraction(0)
+                di[str(ballot.ranking)] = 0.0
             di[str(ballot.ranking)] += ballot.weight
 
         return di
@@ -2,9 +2,14 @@ from votekit.election_types import (
     compute_votes,
     remove_cand,
     fractional_transfer,
+    stv_winner_sets,
+    run_many,
+    CandidateVotes,
     STV,
+    _safe_elimination_batch,
 )  # type:ignore
 from votekit.cvr_loaders import rank_column_csv  # type:ignore
+from fractions import Fraction
 from pathlib import Path
 
 
@@ -78,12 +83,71 @@ def test_stv_winner_mn():
     assert winners == outcome.get_all_winners()
 
 
+def test_run_many():
+    results = run_many(
+        [
+            {"profile": test_profile, "seats": 1},
+            {"profile": test_profile, "seats": 2, "keep_history": True},
+        ],
+        n_jobs=2,
+    )
+    assert results[0].get_all_winners() == ["a"]
+    assert results[0].previous is None
+    assert len(results[1].get_all_winners()) == 2
+    assert results[1].previous is not None
+
+
+def test_safe_elimination_batch():
+    fp_votes = [
+        CandidateVotes(cand="a", votes=10),
+        CandidateVotes(cand="b", votes=5),
+        CandidateVotes(cand="c", votes=2),
+        CandidateVotes(cand="d", votes=1),
+    ]
+    # c and d together (3 votes) cannot overtake b; weakest comes first
+    assert _safe_elimination_batch(fp_votes, 2, 14) == ["d", "c"]
+    # batching both could lift a (10 + 3 = 13) past a threshold of 12 and
+    # change a's surplus, so only d is safe
+    assert _safe_elimination_batch(fp_votes, 2, 12) == ["d"]
+    # a tie for last place is never safe to batch
+    tied = [CandidateVotes(cand="a", votes=3), CandidateVotes(cand="b", votes=3)]
+    assert _safe_elimination_batch(tied, 1, 10) == []
+
+
+def test_winner_sets_fast_path_mn():
+    winners = stv_winner_sets(mn_profile, 3)
+    assert winners == ["BETSY HODGES", "MARK ANDREW", "DON SAMUELS"]
+
+
 def test_runstep_seats_full_at_start():
     mock = STV(test_profile, fractional_transfer, 9)
     step = mock.get_init_profile()
     assert step == test_profile
 
 
+def test_custom_transfer_matches_matrix_engine_mn():
+    # wrapping fractional_transfer in a custom callable forces the
+    # ballot-list engine, which must agree with the matrix engine
+    def transfer(winner, ballots, votes, threshold):
+        return fractional_transfer(winner, ballots, votes, threshold)
+
+    matrix_outcome = STV(mn_profile, fractional_transfer, 3).run_election()
+    ballot_outcome = STV(mn_profile, transfer, 3).run_election()
+    assert ballot_outcome.get_all_winners() == matrix_outcome.get_all_winners()
+    assert ballot_outcome.get_all_eliminated() == matrix_outcome.get_all_eliminated()
+
+
+def test_exact_mode_matches_float_engine_mn():
+    outcome = STV(mn_profile, fractional_transfer, 3, exact=True).run_election()
+    assert outcome.get_all_winners() == ["BETSY HODGES", "MARK ANDREW", "DON SAMUELS"]
+
+
+def test_exact_mode_keeps_fraction_weights():
+    irv = STV(test_profile, fractional_transfer, 1, exact=True)
+    out = irv.run_step()
+    assert all(isinstance(b.weight, Fraction) for b in out.profile.get_ballots())
+
+
 def test_runstep_update_inplace_mn():
     irv = STV(mn_profile, fractional_transfer, 1)
     out = irv.run_step()
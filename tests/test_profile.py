@@ -33,6 +33,19 @@ def test_updates_not_in_place():
     assert remove in test_profile.get_candidates()
 
 
+def test_condense_ballots():
+    profile = PreferenceProfile(
+        ballots=[
+            Ballot(ranking=[{"A"}, {"B"}], weight=Fraction(1)),
+            Ballot(ranking=[{"A"}, {"B"}], weight=Fraction(2)),
+            Ballot(ranking=[{"B"}], weight=Fraction(1)),
+        ]
+    )
+    condensed = profile.condense_ballots()
+    assert len(condensed.get_ballots()) == 2
+    assert condensed.num_ballots() == profile.num_ballots()
+
+
 def test_to_dict():
     rv = test_profile.to_dict()
     assert rv["[{'a'}, {'b'}, {'c'}]"] == Fraction(2, 1)